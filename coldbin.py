@@ -1,4 +1,5 @@
 import pygame
+import numpy as np
 
 class ColdBin:
     def __init__(self, psg_x, psg_y, psg_width):
@@ -23,16 +24,49 @@ class ColdBin:
         self.opening_end_x = self.opening_start_x + self.opening_width
         self.floor_y = self.y + self.height - self.thickness
         
+        # Screen rectangles and glow overlay, built on first draw for the given cell size
+        self._draw_cell_size = None
+        
+        # Boolean mask of wall cells over the whole grid, see bake_wall_mask
+        self.wall_mask = None
+        
     def open_bin(self):
         """Open the bin by removing center floor tiles"""
-        self.is_open = True
+        if not self.is_open:
+            self.is_open = True
+            self._set_opening_walls(False)
         
     def close_bin(self):
         """Close the bin by restoring center floor tiles"""
-        self.is_open = False
-        
+        if self.is_open:
+            self.is_open = False
+            self._set_opening_walls(True)
+    
+    def bake_wall_mask(self, grid_width, grid_height):
+        """Build a grid-sized boolean wall mask, kept in sync by open_bin/close_bin"""
+        mask = np.zeros((grid_height, grid_width), dtype=bool)
+        mask[self.y:self.y + self.height, self.x:self.x + self.thickness] = True
+        mask[self.y:self.y + self.height,
+             self.x + self.width - self.thickness:self.x + self.width] = True
+        mask[self.floor_y:self.floor_y + self.thickness, self.x:self.x + self.width] = True
+        self.wall_mask = mask
+        self._wall_cells = memoryview(mask)
+        self._mask_width, self._mask_height = grid_width, grid_height
+        if self.is_open:
+            self._set_opening_walls(False)
+    
+    def _set_opening_walls(self, solid):
+        """Flip the opening's floor tiles in the wall mask (only they change on open/close)"""
+        if self.wall_mask is not None:
+            self.wall_mask[self.floor_y:self.floor_y + self.thickness,
+                           self.opening_start_x:self.opening_end_x] = solid
+    
     def is_wall(self, x, y):
         """Check if position is a wall of the bin (solid)"""
+        if self.wall_mask is not None:
+            return (0 <= x < self._mask_width and 0 <= y < self._mask_height and
+                    self._wall_cells[y, x])
+        
         # Left wall
         if (x >= self.x and x < self.x + self.thickness and 
             y >= self.y and y < self.y + self.height):
@@ -61,6 +95,11 @@ class ColdBin:
                 y >= self.y and 
                 y < self.y + self.height - self.thickness)
     
+    def get_inside_rect(self):
+        """Get the inside of the bin as a rectangle (x, y, width, height) in grid cells"""
+        return (self.x + self.thickness, self.y,
+                self.width - 2 * self.thickness, self.height - self.thickness)
+    
     def get_bin_bounds(self):
         """Get the bounds of the bin for collision detection"""
         return {
@@ -73,78 +112,65 @@ class ColdBin:
             'inner_bottom': self.y + self.height - self.thickness
         }
     
+    def get_wall_rects(self):
+        """Get the solid wall rectangles (x, y, width, height) in grid cells for the current state"""
+        rects = [
+            (self.x, self.y, self.thickness, self.height),
+            (self.x + self.width - self.thickness, self.y, self.thickness, self.height)
+        ]
+        if self.is_open:
+            rects.append((self.x, self.floor_y, self.opening_start_x - self.x, self.thickness))
+            rects.append((self.opening_end_x, self.floor_y,
+                          self.x + self.width - self.opening_end_x, self.thickness))
+        else:
+            rects.append((self.x, self.floor_y, self.width, self.thickness))
+        return rects
+    
     def draw(self, screen, cell_size):
         """Draw the cold bin on screen"""
-        # Draw walls as dark blue rectangles
-        wall_color = (25, 25, 112)  # Dark blue
+        if self._draw_cell_size != cell_size:
+            self._build_draw_cache(cell_size)
         
-        # Left wall
-        left_wall = pygame.Rect(
-            self.x * cell_size,
-            self.y * cell_size,
-            self.thickness * cell_size,
-            self.height * cell_size
-        )
-        pygame.draw.rect(screen, wall_color, left_wall)
-        
-        # Right wall
-        right_wall = pygame.Rect(
-            (self.x + self.width - self.thickness) * cell_size,
-            self.y * cell_size,
-            self.thickness * cell_size,
-            self.height * cell_size
-        )
-        pygame.draw.rect(screen, wall_color, right_wall)
-        
-        # Bottom wall - draw in sections if open
-        if self.is_open:
-            # Draw left part of bottom wall
-            if self.opening_start_x > self.x:
-                left_bottom = pygame.Rect(
-                    self.x * cell_size,
-                    self.floor_y * cell_size,
-                    (self.opening_start_x - self.x) * cell_size,
-                    self.thickness * cell_size
-                )
-                pygame.draw.rect(screen, wall_color, left_bottom)
-            
-            # Draw right part of bottom wall
-            if self.opening_end_x < self.x + self.width:
-                right_bottom = pygame.Rect(
-                    self.opening_end_x * cell_size,
-                    self.floor_y * cell_size,
-                    (self.x + self.width - self.opening_end_x) * cell_size,
-                    self.thickness * cell_size
-                )
-                pygame.draw.rect(screen, wall_color, right_bottom)
-                
-            # Draw opening indicator
-            opening_rect = pygame.Rect(
-                self.opening_start_x * cell_size,
-                self.floor_y * cell_size,
-                self.opening_width * cell_size,
-                self.thickness * cell_size
-            )
-            pygame.draw.rect(screen, (12, 12, 56), opening_rect)  # Darker blue for opening
-        else:
-            # Draw complete bottom wall when closed
-            bottom_wall = pygame.Rect(
-                self.x * cell_size,
-                self.floor_y * cell_size,
-                self.width * cell_size,
-                self.thickness * cell_size
-            )
-            pygame.draw.rect(screen, wall_color, bottom_wall)
+        # Walls are plain rectangles, so fill them directly
+        for color, rect in self._wall_fills[self.is_open]:
+            screen.fill(color, rect)
         
         # Draw a subtle inner glow to show it's cold
-        inner_rect = pygame.Rect(
-            (self.x + self.thickness) * cell_size,
-            self.y * cell_size,
-            (self.width - 2 * self.thickness) * cell_size,
-            (self.height - self.thickness) * cell_size
-        )
-        # Draw a translucent blue overlay
-        glow_surface = pygame.Surface((inner_rect.width, inner_rect.height))
-        glow_surface.set_alpha(30)
-        glow_surface.fill((100, 150, 255))
-        screen.blit(glow_surface, (inner_rect.x, inner_rect.y))
\ No newline at end of file
+        screen.blit(self._glow_surface, self._glow_rect)
+    
+    def _build_draw_cache(self, cell_size):
+        """Scale the wall rectangles and build the glow overlay for a cell size"""
+        wall_color = (25, 25, 112)  # Dark blue
+        opening_color = (12, 12, 56)  # Darker blue for opening
+        
+        def scaled(x, y, width, height):
+            return pygame.Rect(x * cell_size, y * cell_size, width * cell_size, height * cell_size)
+        
+        # Left and right walls
+        sides = [
+            (wall_color, scaled(self.x, self.y, self.thickness, self.height)),
+            (wall_color, scaled(self.x + self.width - self.thickness, self.y,
+                                self.thickness, self.height))
+        ]
+        
+        # Bottom wall in one piece when closed, in sections around the opening when open
+        closed = sides + [(wall_color, scaled(self.x, self.floor_y, self.width, self.thickness))]
+        opened = list(sides)
+        if self.opening_start_x > self.x:
+            opened.append((wall_color, scaled(self.x, self.floor_y,
+                                              self.opening_start_x - self.x, self.thickness)))
+        if self.opening_end_x < self.x + self.width:
+            opened.append((wall_color, scaled(self.opening_end_x, self.floor_y,
+                                              self.x + self.width - self.opening_end_x,
+                                              self.thickness)))
+        opened.append((opening_color, scaled(self.opening_start_x, self.floor_y,
+                                             self.opening_width, self.thickness)))
+        self._wall_fills = {False: closed, True: opened}
+        
+        # Translucent blue overlay over the inside of the bin
+        self._glow_rect = scaled(self.x + self.thickness, self.y,
+                                 self.width - 2 * self.thickness, self.height - self.thickness)
+        self._glow_surface = pygame.Surface(self._glow_rect.size)
+        self._glow_surface.set_alpha(30)
+        self._glow_surface.fill((100, 150, 255))
+        self._draw_cell_size = cell_size
\ No newline at end of file
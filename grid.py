@@ -1,16 +1,92 @@
 import pygame
-import random
+import numpy as np
 from particle import Particle
 
+# Per-cell flag bits, rebuilt once per frame by Grid.update_cell_flags
+BLOCKED = 1     # Particles may not fall into this cell (wall or closed lift cell)
+NO_GRAVITY = 2  # Particles here are moved by the lift or separator, not by gravity
+SLOW = 4        # Particles here only fall every few frames (PSG)
+
+
+def _fill_rects(mask, rects, value=True):
+    """Set every cell covered by the (x, y, width, height) rects in a 2D mask"""
+    for x, y, w, h in rects:
+        mask[max(0, y):max(0, y + h), max(0, x):max(0, x + w)] = value
+
+
 class Grid:
     def __init__(self, width, height, cell_size):
         self.width = width
         self.height = height
         self.cell_size = cell_size
-        self.grid = [[None for _ in range(width)] for _ in range(height)]
         
-        # Speed tracking for PSG particles
-        self.psg_speed_counter = {}  # Track frame counters for particles in PSG
+        # Contiguous ID grid: each cell holds the ID of its particle or -1 when
+        # empty. IDs index into self.particles; freed IDs are reused.
+        self.ids = np.full((height, width), -1, dtype=np.int32)
+        self.particles = []
+        # Scalar reads/writes go through a memoryview of the same buffer, which
+        # is much cheaper per access than indexing the ndarray from Python
+        self._cells = memoryview(self.ids)
+        self._free_ids = []
+        
+        # Per-particle state as columns indexed by particle ID, which Particle
+        # objects read through while placed. A cell holds at most one particle,
+        # so IDs stay below width * height and the columns never need to grow.
+        capacity = width * height
+        self.particle_x = np.zeros(capacity, dtype=np.int32)
+        self.particle_y = np.zeros(capacity, dtype=np.int32)
+        # Temperatures are whole degrees in 0..max_temperature (500 by default),
+        # so 16 bits hold them with room to spare; Particle and store_temperatures
+        # round and clamp new values to -32768..32767 before they get here
+        self.temperature = np.zeros(capacity, dtype=np.int16)
+        self.max_temperature = np.zeros(capacity, dtype=np.int16)
+        self._xs = memoryview(self.particle_x)
+        self._ys = memoryview(self.particle_y)
+        self._temperatures = memoryview(self.temperature)
+        self._max_temperatures = memoryview(self.max_temperature)
+        # Frame of each particle's last thermal loss and frames between losses
+        self.last_thermal_loss_frame = np.zeros(capacity, dtype=np.int64)
+        self.thermal_loss_interval = np.zeros(capacity, dtype=np.int32)
+        self._last_loss_frames = memoryview(self.last_thermal_loss_frame)
+        self._loss_intervals = memoryview(self.thermal_loss_interval)
+        
+        # Per-cell particle colors as packed pixel values of _cell_surface,
+        # indexed [x, y] to match pygame.surfarray. Black marks an empty cell
+        # and is used as the colorkey when blitting.
+        self._cell_surface = pygame.Surface((width, height))
+        self._empty_color = self._cell_surface.map_rgb((0, 0, 0))
+        self._color_buf = np.full((width, height), self._empty_color, dtype=np.uint32)
+        self._colors = memoryview(self._color_buf)
+        
+        # Packed colors by integer temperature, so recoloring skips get_color
+        reference = Particle(0, 0)
+        self._lut_max_temperature = reference.max_temperature
+        self._color_lut = []
+        for temperature in range(reference.max_temperature + 1):
+            reference.temperature = temperature
+            self._color_lut.append(self._cell_surface.map_rgb(reference.get_color()))
+        self._color_table = np.array(self._color_lut, dtype=np.uint32)
+        
+        self._screen_surface = pygame.Surface((width * cell_size, height * cell_size))
+        self._screen_surface.set_colorkey((0, 0, 0))
+        # IDs of particles whose temperature changed since the last draw. Moves
+        # carry their color along in the buffer, so only these need recoloring.
+        self._dirty_ids = set()
+        
+        # Per-cell BLOCKED/NO_GRAVITY/SLOW flags, see update_cell_flags
+        self.cell_flags = np.zeros((height, width), dtype=np.uint8)
+        self._static_flags = np.zeros((height, width), dtype=np.uint8)
+        self._flags = memoryview(self.cell_flags)
+        
+        # Speed tracking for PSG particles: frames spent in the PSG per particle
+        # ID, kept modulo the PSG slow factor (0 for particles outside the PSG)
+        self.psg_counter = np.zeros(capacity, dtype=np.int16)
+        self._psg_counts = memoryview(self.psg_counter)
+        
+        # Coin flips for diagonal falls, generated in blocks and consumed in order
+        self._rng = np.random.default_rng()
+        self._rand_bits = b''
+        self._rand_idx = 0
         
     def is_valid_position(self, x, y):
         """Check if position is within grid bounds"""
@@ -18,53 +94,151 @@ class Grid:
     
     def is_empty(self, x, y):
         """Check if position is empty"""
-        if not self.is_valid_position(x, y):
-            return False
-        return self.grid[y][x] is None
+        return 0 <= x < self.width and 0 <= y < self.height and self._cells[y, x] < 0
     
     def place_particle(self, particle, x, y):
         """Place particle at position"""
         if self.is_valid_position(x, y):
-            self.grid[y][x] = particle
+            if self._cells[y, x] >= 0:
+                self.remove_particle(x, y)
+            if self._free_ids:
+                particle_id = self._free_ids.pop()
+                self.particles[particle_id] = particle
+            else:
+                particle_id = len(self.particles)
+                self.particles.append(particle)
+            particle.attach(self, particle_id)
             particle.move_to(x, y)
+            self._cells[y, x] = particle_id
+            self._colors[x, y] = self._packed_color(particle)
             return True
         return False
     
     def remove_particle(self, x, y):
         """Remove particle from position"""
         if self.is_valid_position(x, y):
-            particle = self.grid[y][x]
-            self.grid[y][x] = None
-            # Clean up PSG speed tracking if particle is removed
-            particle_id = id(particle) if particle else None
-            if particle_id in self.psg_speed_counter:
-                del self.psg_speed_counter[particle_id]
+            particle_id = self._cells[y, x]
+            if particle_id < 0:
+                return None
+            particle = self.particles[particle_id]
+            self.particles[particle_id] = None
+            self._free_ids.append(particle_id)
+            self._cells[y, x] = -1
+            self._colors[x, y] = self._empty_color
+            # Reset PSG speed tracking so the ID can be reused
+            self._psg_counts[particle_id] = 0
+            particle.detach()
             return particle
         return None
     
+    def _packed_color(self, particle):
+        """Get a particle's color as a pixel value, from the lookup table when possible"""
+        temperature = particle.temperature
+        if (0 <= temperature <= self._lut_max_temperature and
+                particle.max_temperature == self._lut_max_temperature):
+            return self._color_lut[temperature]
+        return self._cell_surface.map_rgb(particle.get_color())
+    
+    def mark_dirty(self, x, y):
+        """Flag the particle at position for recoloring on the next draw"""
+        particle_id = self._cells[y, x]
+        if particle_id >= 0:
+            self._dirty_ids.add(particle_id)
+    
+    def mark_dirty_id(self, particle_id):
+        """Flag a single particle ID for recoloring on the next draw"""
+        self._dirty_ids.add(particle_id)
+    
+    def mark_dirty_ids(self, particle_ids):
+        """Flag an array of particle IDs for recoloring on the next draw"""
+        self._dirty_ids.update(particle_ids.tolist())
+    
+    def store_temperatures(self, particle_ids, temperatures):
+        """Store new temperatures for an array of particle IDs and return them as stored"""
+        # Same rounding and clamping as Particle.temperature, so bulk updates
+        # agree with Particle.heat and Particle.cool
+        stored = np.clip(np.rint(temperatures), -32768, 32767).astype(np.int16)
+        changed = stored != self.temperature[particle_ids]
+        self.temperature[particle_ids] = stored
+        self.mark_dirty_ids(particle_ids[changed])
+        return stored
+    
     def get_particle(self, x, y):
         """Get particle at position"""
-        if self.is_valid_position(x, y):
-            return self.grid[y][x]
+        if 0 <= x < self.width and 0 <= y < self.height:
+            particle_id = self._cells[y, x]
+            if particle_id >= 0:
+                return self.particles[particle_id]
         return None
     
+    def particles_in_region(self, x, y, width, height):
+        """List (x, y, particle) for every occupied cell in a rectangle, in row-major order"""
+        x0, y0 = max(0, x), max(0, y)
+        region = self.ids[y0:max(0, y + height), x0:max(0, x + width)]
+        ys, xs = np.nonzero(region >= 0)
+        particles = self.particles
+        return [(x0 + cx, y0 + cy, particles[particle_id])
+                for cy, cx, particle_id in zip(ys.tolist(), xs.tolist(), region[ys, xs].tolist())]
+    
+    def ids_in_region(self, x, y, width, height):
+        """Get the IDs of the particles in a rectangle as an array, in row-major order"""
+        region = self.ids[max(0, y):max(0, y + height), max(0, x):max(0, x + width)]
+        return region[region >= 0]
+    
     def move_particle(self, from_x, from_y, to_x, to_y):
         """Move particle from one position to another"""
-        if not self.is_valid_position(from_x, from_y) or not self.is_valid_position(to_x, to_y):
+        width, height = self.width, self.height
+        if not (0 <= from_x < width and 0 <= from_y < height and
+                0 <= to_x < width and 0 <= to_y < height):
             return False
         
-        if self.grid[from_y][from_x] is None or self.grid[to_y][to_x] is not None:
+        particle_id = self._cells[from_y, from_x]
+        if particle_id < 0 or self._cells[to_y, to_x] >= 0:
             return False
         
-        particle = self.grid[from_y][from_x]
-        self.grid[from_y][from_x] = None
-        self.grid[to_y][to_x] = particle
-        particle.move_to(to_x, to_y)
+        self._relocate(particle_id, from_x, from_y, to_x, to_y)
         return True
     
+    def move_particles(self, moves):
+        """Apply (x, y, candidates) moves in order and return where each particle ended up"""
+        # Each particle takes its first empty candidate cell, or stays put (None)
+        width, height = self.width, self.height
+        cells, colors = self._cells, self._colors
+        xs, ys = self._xs, self._ys
+        empty_color = self._empty_color
+        destinations = []
+        for from_x, from_y, candidates in moves:
+            destination = None
+            if 0 <= from_x < width and 0 <= from_y < height:
+                particle_id = cells[from_y, from_x]
+                if particle_id >= 0:
+                    for to_x, to_y in candidates:
+                        if 0 <= to_x < width and 0 <= to_y < height and cells[to_y, to_x] < 0:
+                            # Same as _relocate, inlined for the batch
+                            cells[from_y, from_x] = -1
+                            cells[to_y, to_x] = particle_id
+                            colors[to_x, to_y] = colors[from_x, from_y]
+                            colors[from_x, from_y] = empty_color
+                            xs[particle_id] = to_x
+                            ys[particle_id] = to_y
+                            destination = (to_x, to_y)
+                            break
+            destinations.append(destination)
+        return destinations
+    
+    def _relocate(self, particle_id, from_x, from_y, to_x, to_y):
+        """Move a particle to an empty cell without any checks (callers validate)"""
+        cells, colors = self._cells, self._colors
+        cells[from_y, from_x] = -1
+        cells[to_y, to_x] = particle_id
+        colors[to_x, to_y] = colors[from_x, from_y]
+        colors[from_x, from_y] = self._empty_color
+        self._xs[particle_id] = to_x
+        self._ys[particle_id] = to_y
+    
     def can_particle_fall(self, x, y):
         """Check if particle can fall down"""
-        if not self.is_valid_position(x, y) or self.grid[y][x] is None:
+        if not self.is_valid_position(x, y) or self._cells[y, x] < 0:
             return False
         
         # Check if can fall straight down
@@ -82,133 +256,199 @@ class Grid:
     
     def should_particle_move_slowly(self, x, y, psg=None):
         """Check if particle should move slowly due to PSG"""
+        particle_id = self._cells[y, x]
         if psg and psg.should_particle_move_slow(x, y):
-            particle = self.get_particle(x, y)
-            if particle:
-                particle_id = id(particle)
-                # Initialize or increment counter for this particle
-                if particle_id not in self.psg_speed_counter:
-                    self.psg_speed_counter[particle_id] = 0
-                self.psg_speed_counter[particle_id] += 1
-                
+            if particle_id >= 0:
                 # Only allow movement every psg.slow_factor frames
-                return self.psg_speed_counter[particle_id] % psg.slow_factor == 0
-        else:
-            # Clean up counter if particle is no longer in PSG
-            particle = self.get_particle(x, y)
-            if particle:
-                particle_id = id(particle)
-                if particle_id in self.psg_speed_counter:
-                    del self.psg_speed_counter[particle_id]
+                count = (self._psg_counts[particle_id] + 1) % psg.slow_factor
+                self._psg_counts[particle_id] = count
+                return count == 0
+        elif particle_id >= 0:
+            # Reset counter if particle is no longer in PSG
+            self._psg_counts[particle_id] = 0
         
         return True  # Normal speed movement
     
+    def bake_static_flags(self, lift=None, separator=None, psg=None):
+        """Precompute the flags of geometry that never changes (lift, separator, PSG)"""
+        shape = (self.height, self.width)
+        blocked = np.zeros(shape, dtype=bool)
+        no_gravity = np.zeros(shape, dtype=bool)
+        
+        # Separator walls, except the row particles enter through from above
+        if separator is not None:
+            walls = np.zeros(shape, dtype=bool)
+            _fill_rects(walls, separator.get_wall_rects())
+            _fill_rects(walls, [separator.get_entry_rect()], False)
+            blocked |= walls
+            _fill_rects(no_gravity, [separator.get_inside_rect()])
+        
+        # Lift cells, except the entry row at the top of the cold bin shaft
+        if lift is not None:
+            if lift.lift_mask is not None and lift.lift_mask.shape == shape:
+                inside = lift.lift_mask.copy()
+            else:
+                inside = np.zeros(shape, dtype=bool)
+                _fill_rects(inside, lift.get_segment_rects())
+            no_gravity |= inside
+            _fill_rects(inside, [lift.get_entry_rect()], False)
+            blocked |= inside
+        
+        slow = np.zeros(shape, dtype=bool)
+        if psg is not None:
+            _fill_rects(slow, [psg.get_inside_rect()])
+        
+        self._static_flags = (blocked * BLOCKED | no_gravity * NO_GRAVITY |
+                              slow * SLOW).astype(np.uint8)
+    
+    def update_cell_flags(self, hotbin=None, coldbin=None):
+        """Rebuild the per-cell flags for the current bin states (call once per frame)"""
+        flags = self.cell_flags
+        flags[...] = self._static_flags
+        
+        # Bin walls depend on whether the bins are currently open
+        for bin_ in (hotbin, coldbin):
+            if bin_ is None:
+                continue
+            if bin_.wall_mask is not None:
+                flags[bin_.wall_mask] |= BLOCKED
+            else:
+                walls = np.zeros(flags.shape, dtype=bool)
+                _fill_rects(walls, bin_.get_wall_rects())
+                flags[walls] |= BLOCKED
+    
+    def update_particles(self, psg=None):
+        """Update every particle for one frame, bottom to top and right to left"""
+        ids, flags = self.ids, self.cell_flags
+        occupied = ids[:-1] >= 0  # Skip bottom row
+        active = occupied & ((flags[:-1] & NO_GRAVITY) == 0)
+        
+        # Advance the PSG speed counters up front. Each counter is only touched
+        # by its own particle, so doing them all at once keeps the same result.
+        if psg:
+            in_psg = occupied & ((flags[:-1] & SLOW) != 0)
+            slow_ids = ids[:-1][in_psg]
+            counts = (self.psg_counter[slow_ids] + 1) % psg.slow_factor
+            self.psg_counter[slow_ids] = counts
+            self.psg_counter[ids[:-1][occupied & ~in_psg]] = 0
+            active[in_psg] &= counts == 0
+        
+        # Rows are swept bottom-up with NumPy. Row y + 1 is final by the time
+        # row y is swept, so free cells below can only fill up from here on.
+        open_cells = (flags & BLOCKED) == 0
+        free = np.zeros(self.width + 2, dtype=bool)     # Row below, padded both sides
+        movers = np.zeros(self.width + 1, dtype=bool)   # Padded on the right
+        color_buf = self._color_buf
+        fall = self._fall_particle
+        for y in np.flatnonzero(active.any(axis=1))[::-1].tolist():
+            free[1:-1] = (ids[y + 1] < 0) & open_cells[y + 1]
+            # Anything with no free cell beneath it now cannot move this frame
+            movers[:-1] = active[y] & (free[:-2] | free[1:-1] | free[2:])
+            if not movers.any():
+                continue
+            
+            # A straight fall is certain unless the right-hand neighbour, which
+            # goes first, might slide into the same cell. Do those in bulk.
+            xs = np.flatnonzero(movers[:-1] & free[1:-1] & ~movers[1:])
+            if len(xs):
+                moved = ids[y, xs]
+                ids[y + 1, xs] = moved
+                ids[y, xs] = -1
+                color_buf[xs, y + 1] = color_buf[xs, y]
+                color_buf[xs, y] = self._empty_color
+                self.particle_y[moved] = y + 1
+                movers[xs] = False
+                free[xs + 1] = False
+            
+            # The rest may compete for cells, so settle them one by one in order
+            rest = np.flatnonzero(movers[:-1])
+            if len(rest):
+                below = free.tolist()
+                for x in rest[::-1].tolist():
+                    fall(x, y, below)
+    
     def update_particle(self, x, y, hotbin=None, coldbin=None, lift=None, separator=None, psg=None):
         """Update single particle physics"""
-        if not self.is_valid_position(x, y) or self.grid[y][x] is None:
+        # Bin walls and lift/separator cells come from the cell flags, so call
+        # bake_static_flags and update_cell_flags first. hotbin, coldbin, lift
+        # and separator are kept for existing callers and are otherwise unused.
+        if not self.is_valid_position(x, y) or self._cells[y, x] < 0:
             return False
         
         # Check if particle should move slowly due to PSG
         if psg and not self.should_particle_move_slowly(x, y, psg):
             return False
         
-        # Special handling for particles in lift system
-        if lift and lift.is_inside_lift(x, y):
-            # Don't apply normal gravity in lift - let lift handle movement
+        # Don't apply normal gravity in the lift or separator - they handle movement
+        if self._flags[y, x] & NO_GRAVITY:
             return False
         
-        # Special handling for particles in separator
-        if separator and separator.is_inside(x, y):
-            # Don't apply normal gravity in separator - let separator handle redistribution
+        if y + 1 >= self.height:
             return False
+        return self._fall_particle(x, y, self._legal_row(y + 1))
+    
+    def _legal_row(self, y):
+        """Get which cells of row y a particle may fall into, padded by one cell each side"""
+        legal = (self.ids[y] < 0) & ((self.cell_flags[y] & BLOCKED) == 0)
+        return [False] + legal.tolist() + [False]
+    
+    def _fall_particle(self, x, y, below):
+        """Move a particle down or diagonally down into a free cell of the row below"""
+        # below is the padded legality of row y + 1 (below[x + 1] is cell x);
+        # the cell taken is marked so later particles in the row see it filled
+        if below[x + 1]:
+            direction = 0
+        else:
+            left_ok, right_ok = below[x], below[x + 2]
+            if left_ok and right_ok:
+                direction = 1 if self._random_bit() else -1
+            elif left_ok:
+                direction = -1
+            elif right_ok:
+                direction = 1
+            else:
+                return False
+        below[x + 1 + direction] = False
+        self._relocate(self._cells[y, x], x, y, x + direction, y + 1)
+        return True
+    
+    def _random_bit(self):
+        """Return the next pre-generated random bit, refilling the block when used up"""
+        idx = self._rand_idx
+        if idx >= len(self._rand_bits):
+            self._rand_bits = self._rng.integers(0, 2, size=65536, dtype=np.uint8).tobytes()
+            idx = 0
+        self._rand_idx = idx + 1
+        return self._rand_bits[idx]
+    
+    def _recolor(self, particle_ids):
+        """Refresh the color buffer for an array of particle IDs"""
+        # Freed IDs keep their last position; skip any no longer in that cell
+        xs, ys = self.particle_x[particle_ids], self.particle_y[particle_ids]
+        live = self.ids[ys, xs] == particle_ids
+        particle_ids, xs, ys = particle_ids[live], xs[live], ys[live]
         
-        # Try to fall straight down first
-        target_y = y + 1
-        
-        # Check if particle can enter lift system - allow entry across the full width
-        can_enter_lift = False
-        if lift and lift.is_inside_lift(x, target_y):
-            # Allow entry into lift if it's at the entry level
-            entry_x, entry_y = lift.get_entry_position()
-            # Check if we're at the right y level and within the shaft width
-            if (target_y == entry_y and 
-                entry_x <= x < entry_x + lift.shaft_width):
-                can_enter_lift = True
-        
-        # Check if particle can enter separator
-        can_enter_separator = False
-        if separator and separator.can_enter_separator(x, target_y):
-            can_enter_separator = True
-        
-        if (target_y < self.height and 
-            self.is_empty(x, target_y) and 
-            (hotbin is None or not hotbin.is_wall(x, target_y)) and
-            (coldbin is None or not coldbin.is_wall(x, target_y)) and
-            (separator is None or not separator.is_wall(x, target_y) or can_enter_separator) and
-            (lift is None or not lift.is_inside_lift(x, target_y) or can_enter_lift)):
-            return self.move_particle(x, y, x, target_y)
-        
-        # Try to fall diagonally
-        directions = []
-        
-        # Check left diagonal
-        can_enter_lift_left = False
-        if lift and lift.is_inside_lift(x - 1, target_y):
-            entry_x, entry_y = lift.get_entry_position()
-            if (target_y == entry_y and 
-                entry_x <= x - 1 < entry_x + lift.shaft_width):
-                can_enter_lift_left = True
-        
-        can_enter_separator_left = False
-        if separator and separator.can_enter_separator(x - 1, target_y):
-            can_enter_separator_left = True
-                
-        if (x > 0 and target_y < self.height and 
-            self.is_empty(x - 1, target_y) and 
-            (hotbin is None or not hotbin.is_wall(x - 1, target_y)) and
-            (coldbin is None or not coldbin.is_wall(x - 1, target_y)) and
-            (separator is None or not separator.is_wall(x - 1, target_y) or can_enter_separator_left) and
-            (lift is None or not lift.is_inside_lift(x - 1, target_y) or can_enter_lift_left)):
-            directions.append(-1)
-            
-        # Check right diagonal
-        can_enter_lift_right = False
-        if lift and lift.is_inside_lift(x + 1, target_y):
-            entry_x, entry_y = lift.get_entry_position()
-            if (target_y == entry_y and 
-                entry_x <= x + 1 < entry_x + lift.shaft_width):
-                can_enter_lift_right = True
-        
-        can_enter_separator_right = False
-        if separator and separator.can_enter_separator(x + 1, target_y):
-            can_enter_separator_right = True
-                
-        if (x < self.width - 1 and target_y < self.height and 
-            self.is_empty(x + 1, target_y) and 
-            (hotbin is None or not hotbin.is_wall(x + 1, target_y)) and
-            (coldbin is None or not coldbin.is_wall(x + 1, target_y)) and
-            (separator is None or not separator.is_wall(x + 1, target_y) or can_enter_separator_right) and
-            (lift is None or not lift.is_inside_lift(x + 1, target_y) or can_enter_lift_right)):
-            directions.append(1)
-        
-        if directions:
-            direction = random.choice(directions)
-            return self.move_particle(x, y, x + direction, target_y)
+        # Integer temperatures on the standard scale come straight from the table
+        temperatures = self.temperature[particle_ids]
+        lut_max = self._lut_max_temperature
+        in_table = ((temperatures >= 0) & (temperatures <= lut_max) &
+                    (self.max_temperature[particle_ids] == lut_max))
+        self._color_buf[xs[in_table], ys[in_table]] = self._color_table[temperatures[in_table]]
         
-        return False
+        particles, colors = self.particles, self._colors
+        for particle_id, x, y in zip(particle_ids[~in_table].tolist(), xs[~in_table].tolist(),
+                                     ys[~in_table].tolist()):
+            colors[x, y] = self._packed_color(particles[particle_id])
     
     def draw(self, screen):
         """Draw the particles only (background handled by simulation)"""
-        # Draw particles
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.grid[y][x] is not None:
-                    particle = self.grid[y][x]
-                    color = particle.get_color()
-                    rect = pygame.Rect(
-                        x * self.cell_size,
-                        y * self.cell_size,
-                        self.cell_size,
-                        self.cell_size
-                    )
-                    pygame.draw.rect(screen, color, rect)
\ No newline at end of file
+        # Recolor only the particles whose temperature changed since last frame
+        if self._dirty_ids:
+            self._recolor(np.fromiter(self._dirty_ids, dtype=np.intp, count=len(self._dirty_ids)))
+            self._dirty_ids.clear()
+        
+        # Upload one pixel per cell, scale up to screen size and blit once
+        pygame.surfarray.blit_array(self._cell_surface, self._color_buf)
+        pygame.transform.scale(self._cell_surface, self._screen_surface.get_size(),
+                               self._screen_surface)
+        screen.blit(self._screen_surface, (0, 0))
\ No newline at end of file
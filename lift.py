@@ -1,9 +1,47 @@
 import pygame
+import numpy as np
+
+# Segment names in the same order as Lift.get_segment_rects()
+SEGMENT_NAMES = ('cb_vertical', 'cb_horizontal', 'main_vertical', 'rcv_horizontal', 'rcv_vertical')
+
+# Segments are updated in reverse order (exit first). Lift moves only ever lead
+# downstream, so a particle never moves into a segment still to be updated.
+SEGMENT_UPDATE_ORDER = ('rcv_vertical', 'rcv_horizontal', 'main_vertical', 'cb_horizontal', 'cb_vertical')
+
+# Order occupied (x, y) cells move in within each segment, ties broken in row-major order
+SEGMENT_SORT_KEYS = {
+    'cb_vertical': lambda c: (-c[1], c[0]),     # Bottom particles move first
+    'cb_horizontal': lambda c: (-c[0], c[1]),   # Rightmost particles move first
+    'main_vertical': lambda c: (c[1], c[0]),    # Top particles move first
+    'rcv_horizontal': lambda c: (c[0], c[1]),   # Leftmost particles move first
+    'rcv_vertical': lambda c: (-c[1], c[0])     # Bottom particles move first
+}
 
 class Lift:
+    # Fixed attribute layout for faster attribute access; the lift gains no attributes at runtime
+    __slots__ = (
+        # Geometry
+        'offset_above_sep', 'cb_left', 'cb_right', 'cb_bottom', 'cb_inner_bottom', 'separator_y',
+        'shaft_width', 'cb_shaft_x', 'cb_shaft_y', 'cb_shaft_height',
+        'cb_hz_shaft_x', 'cb_hz_shaft_y', 'cb_hz_shaft_length',
+        'main_shaft_x', 'main_shaft_y', 'main_shaft_height',
+        'rcv_hz_shaft_x', 'rcv_hz_shaft_y', 'rcv_hz_shaft_length',
+        'rcv_vt_shaft_x', 'rcv_vt_shaft_y', 'rcv_vt_shaft_height',
+        # Movement and conservation tracking
+        'lift_speed', '_move_budget', '_population', 'particles_entered', 'particles_exited',
+        # Routing and baked masks
+        '_segment_bounds', '_next_positions', '_exit_row', '_entry_cells', '_lift_mask',
+        '_segment_map', '_row_bits', '_mask_width', '_mask_height', '_scan_cells', '_scan_index',
+        '_scan_moves', '_entry_scan',
+        # Draw cache
+        '_draw_cell_size', '_draw_surface', '_draw_pos'
+    )
+    
     def __init__(self, coldbin, separator_y):
         self.offset_above_sep = 11
-        self.coldbin_bounds = coldbin.get_bin_bounds()
+        bounds = coldbin.get_bin_bounds()
+        self.cb_left, self.cb_right = bounds['left'], bounds['right']
+        self.cb_bottom, self.cb_inner_bottom = bounds['bottom'], bounds['inner_bottom']
         self.separator_y = separator_y
         
         # Lift dimensions
@@ -11,13 +49,13 @@ class Lift:
         
         # Vertical cold bin shaft (connects to bottom of cold bin)
         self.cb_shaft_x = coldbin.opening_start_x 
-        self.cb_shaft_y = self.coldbin_bounds['inner_bottom']  # Bottom of cold bin
+        self.cb_shaft_y = self.cb_inner_bottom  # Bottom of cold bin
         self.cb_shaft_height = 5  # Height of vertical section
         
         # Horizontal cold bin shaft (elbow going right connecting to main length)
         self.cb_hz_shaft_x = self.cb_shaft_x
         self.cb_hz_shaft_y = self.cb_shaft_y + self.cb_shaft_height
-        self.cb_hz_shaft_length = self.coldbin_bounds['right'] - self.coldbin_bounds['left']
+        self.cb_hz_shaft_length = self.cb_right - self.cb_left
 
         # Vertical main shaft
         self.main_shaft_x = self.cb_hz_shaft_x + self.cb_hz_shaft_length
@@ -38,183 +76,219 @@ class Lift:
         
         # Particle movement speed (cells per update)
         self.lift_speed = 0.3  # Slower than gravity for realistic movement
-        self.frame_counter = 0
+        self._move_budget = 0.0  # Accumulated lift_speed, one move per whole cell
+        self._population = 0  # Particles left in the lift by the last update
         
         # Particle conservation tracking
         self.particles_entered = 0
         self.particles_exited = 0
         
+        # Routing table: candidate next positions for every lift cell. The
+        # geometry never changes, so routing is computed once up front.
+        self._next_positions = {}
+        for segment_name, (sx, sy, sw, sh) in zip(SEGMENT_NAMES, self.get_segment_rects()):
+            for y in range(sy, sy + sh):
+                for x in range(sx, sx + sw):
+                    if (x, y) not in self._next_positions:
+                        self._next_positions[(x, y)] = tuple(
+                            self._compute_next_positions(x, y, segment_name))
+        
+        # Half-open (x0, y0, x1, y1) bounds of the segments in SEGMENT_NAMES order,
+        # for the per-segment membership tests
+        self._segment_bounds = tuple((x, y, x + w, y + h) for x, y, w, h in self.get_segment_rects())
+        
+        # Bottom row of the receiver shaft, where particles leave the lift
+        self._exit_row = self.rcv_vt_shaft_y + self.rcv_vt_shaft_height - 1
+        
+        # Cells of the entry row, the only way particles get into the lift
+        entry_x, entry_y = self.get_entry_position()
+        self._entry_cells = [(x, entry_y) for x in range(entry_x, entry_x + self.shaft_width)]
+        
+        # Boolean mask of lift cells over the whole grid, see bake_mask
+        self._lift_mask = None
+        
+        # Pre-rendered shafts and their screen position, built on first draw for the given cell size
+        self._draw_cell_size = None
+        
     def is_wall(self, x, y):
         """Check if position is a wall of the lift system - since we don't draw walls, return False"""
         return False
     
+    def bake_mask(self, grid_width, grid_height):
+        """Precompute grid-sized segment id and lift cell masks for O(1) lookups"""
+        # Segment id of every cell: 0 outside the lift, else 1 + index in SEGMENT_NAMES.
+        # Filled in reverse so that where segments overlap the first one listed wins.
+        segment_map = np.zeros((grid_height, grid_width), dtype=np.int8)
+        segment_rects = self.get_segment_rects()
+        for segment_id in range(len(segment_rects), 0, -1):
+            x, y, w, h = segment_rects[segment_id - 1]
+            segment_map[max(0, y):max(0, y + h), max(0, x):max(0, x + w)] = segment_id
+        self._segment_map = segment_map
+        
+        mask = segment_map != 0
+        mask.setflags(write=False)  # Shared through lift_mask, so keep it read-only
+        self._lift_mask = mask
+        # Each row of the mask packed into one int, bit x set for lift cells
+        self._row_bits = [int.from_bytes(np.packbits(row, bitorder='little').tobytes(), 'little')
+                          for row in mask]
+        self._mask_width, self._mask_height = grid_width, grid_height
+        
+        # Fallback exits for each column of the exit row, keeping only the cells
+        # outside the lift since the geometry decides that once and for all
+        exit_positions = {
+            x: tuple((exit_x, exit_y) for exit_x, exit_y in self._get_exit_positions(x, self._exit_row)
+                     if not self.is_inside_lift(exit_x, exit_y))
+            for x in range(self.rcv_vt_shaft_x, self.rcv_vt_shaft_x + self.shaft_width)
+        }
+        
+        # Every lift cell in update order, each segment's cells sorted in the
+        # order its particles move. Each cell carries its move rule: the
+        # candidate next positions, where particles blocked at the exit row
+        # may also leave sideways.
+        segments = {segment_name: [] for segment_name in SEGMENT_NAMES}
+        ys, xs = np.nonzero(mask)
+        for y, x, segment_id in zip(ys.tolist(), xs.tolist(), segment_map[ys, xs].tolist()):
+            segments[SEGMENT_NAMES[segment_id - 1]].append((x, y))
+        self._scan_cells = []
+        self._scan_moves = []
+        for segment_name in SEGMENT_UPDATE_ORDER:
+            for x, y in sorted(segments[segment_name], key=SEGMENT_SORT_KEYS[segment_name]):
+                positions = self._next_positions[(x, y)]
+                if segment_name == 'rcv_vertical' and y >= self._exit_row:
+                    positions += tuple(position for position in exit_positions[x]
+                                       if position not in positions)
+                self._scan_cells.append((x, y))
+                self._scan_moves.append((x, y, positions))
+        self._scan_index = np.array([y * grid_width + x for x, y in self._scan_cells], dtype=np.intp)
+        scan_positions = {cell: i for i, cell in enumerate(self._scan_cells)}
+        self._entry_scan = np.array([scan_positions[cell] for cell in self._entry_cells
+                                     if cell in scan_positions], dtype=np.intp)
+    
+    @property
+    def lift_mask(self):
+        """Read-only grid-sized boolean mask of lift cells, or None before bake_mask"""
+        return self._lift_mask
+    
     def is_inside_lift(self, x, y):
         """Check if position is inside any part of the lift system"""
-        return (self.is_inside_cb_vertical(x, y) or 
-                self.is_inside_cb_horizontal(x, y) or 
-                self.is_inside_main_vertical(x, y) or
-                self.is_inside_rcv_horizontal(x, y) or
-                self.is_inside_rcv_vertical(x, y))
+        if self._lift_mask is not None:
+            return (0 <= x < self._mask_width and 0 <= y < self._mask_height and
+                    (self._row_bits[y] >> x) & 1 == 1)
+        for x0, y0, x1, y1 in self._segment_bounds:
+            if x0 <= x < x1 and y0 <= y < y1:
+                return True
+        return False
+    
+    def is_inside_lift_batch(self, xs, ys):
+        """Vectorized is_inside_lift over arrays of positions, returning a boolean array"""
+        xs, ys = np.asarray(xs), np.asarray(ys)
+        if self._lift_mask is not None:
+            inside = (0 <= xs) & (xs < self._mask_width) & (0 <= ys) & (ys < self._mask_height)
+            inside[inside] = self._lift_mask[ys[inside], xs[inside]]
+            return inside
+        inside = np.zeros(np.broadcast(xs, ys).shape, dtype=bool)
+        for x0, y0, x1, y1 in self._segment_bounds:
+            inside |= (x0 <= xs) & (xs < x1) & (y0 <= ys) & (ys < y1)
+        return inside
     
     def is_inside_cb_vertical(self, x, y):
         """Check if position is inside the vertical shaft going down from cold bin"""
-        return (self.cb_shaft_x <= x < self.cb_shaft_x + self.shaft_width and
-                self.cb_shaft_y <= y < self.cb_shaft_y + self.cb_shaft_height)
+        x0, y0, x1, y1 = self._segment_bounds[0]
+        return x0 <= x < x1 and y0 <= y < y1
     
     def is_inside_cb_horizontal(self, x, y):
         """Check if position is inside the horizontal section going right"""
-        return (self.cb_hz_shaft_x <= x < self.cb_hz_shaft_x + self.cb_hz_shaft_length and
-                self.cb_hz_shaft_y <= y < self.cb_hz_shaft_y + self.shaft_width)
+        x0, y0, x1, y1 = self._segment_bounds[1]
+        return x0 <= x < x1 and y0 <= y < y1
     
     def is_inside_main_vertical(self, x, y):
         """Check if position is inside the main vertical shaft going up"""
-        return (self.main_shaft_x <= x < self.main_shaft_x + self.shaft_width and
-                self.main_shaft_y <= y < self.main_shaft_y + self.main_shaft_height)
+        x0, y0, x1, y1 = self._segment_bounds[2]
+        return x0 <= x < x1 and y0 <= y < y1
     
     def is_inside_rcv_horizontal(self, x, y):
         """Check if position is inside the horizontal section going left to receiver"""
-        return (self.rcv_hz_shaft_x <= x < self.rcv_hz_shaft_x + self.rcv_hz_shaft_length and
-                self.rcv_hz_shaft_y <= y < self.rcv_hz_shaft_y + self.shaft_width)
+        x0, y0, x1, y1 = self._segment_bounds[3]
+        return x0 <= x < x1 and y0 <= y < y1
     
     def is_inside_rcv_vertical(self, x, y):
         """Check if position is inside the vertical section going down to receiver"""
-        return (self.rcv_vt_shaft_x <= x < self.rcv_vt_shaft_x + self.shaft_width and
-                self.rcv_vt_shaft_y <= y < self.rcv_vt_shaft_y + self.rcv_vt_shaft_height)
+        x0, y0, x1, y1 = self._segment_bounds[4]
+        return x0 <= x < x1 and y0 <= y < y1
     
     def get_entry_position(self):
         """Get the position where particles enter the lift (top of cb vertical shaft)"""
         return (self.cb_shaft_x, self.cb_shaft_y)
     
+    def get_segment_rects(self):
+        """Get the rectangles (x, y, width, height) of all five segments in grid cells"""
+        return [
+            (self.cb_shaft_x, self.cb_shaft_y, self.shaft_width, self.cb_shaft_height),
+            (self.cb_hz_shaft_x, self.cb_hz_shaft_y, self.cb_hz_shaft_length, self.shaft_width),
+            (self.main_shaft_x, self.main_shaft_y, self.shaft_width, self.main_shaft_height),
+            (self.rcv_hz_shaft_x, self.rcv_hz_shaft_y, self.rcv_hz_shaft_length, self.shaft_width),
+            (self.rcv_vt_shaft_x, self.rcv_vt_shaft_y, self.shaft_width, self.rcv_vt_shaft_height)
+        ]
+    
+    def get_entry_rect(self):
+        """Get the entry row where particles may fall into the lift, as (x, y, width, height)"""
+        return (self.cb_shaft_x, self.cb_shaft_y, self.shaft_width, 1)
+    
     def can_enter_lift(self, x, y):
         return (self.cb_shaft_x <= x < self.cb_shaft_x + self.shaft_width and
                 y == self.cb_shaft_y)
     
     def update_particles_in_lift(self, grid):
         """Update particles moving through the lift system with multi-file support"""
-        self.frame_counter += 1
-        
-        # Only move particles every few frames to control speed
-        if self.frame_counter % max(1, int(1 / self.lift_speed)) != 0:
+        # Only move particles once a whole cell of movement has accumulated
+        self._move_budget += self.lift_speed
+        if self._move_budget < 1.0:
             return
+        self._move_budget -= 1.0
         
-        # Track particles entering the lift (at entry point)
-        entry_x, entry_y = self.get_entry_position()
-        for x in range(entry_x, entry_x + self.shaft_width):
-            if (grid.is_valid_position(x, entry_y) and 
-                grid.get_particle(x, entry_y) is not None and
-                not hasattr(grid.get_particle(x, entry_y), '_just_entered_lift')):
-                # Mark particle as just entered to avoid double counting
-                grid.get_particle(x, entry_y)._just_entered_lift = True
-                self.particles_entered += 1
-        
-        particles_to_move = []
-        # Find all particles in lift system
-        for y in range(grid.height):
-            for x in range(grid.width):
-                particle = grid.get_particle(x, y)
-                if particle and self.is_inside_lift(x, y):
-                    # Clear the entry marker after first frame
-                    if hasattr(particle, '_just_entered_lift'):
-                        delattr(particle, '_just_entered_lift')
-                    particles_to_move.append((x, y, particle))
-        
-        # Group particles by segment and process each segment separately
-        # This allows multiple particles to move in parallel within each segment
-        segments = {
-            'cb_vertical': [],
-            'cb_horizontal': [],
-            'main_vertical': [],
-            'rcv_horizontal': [],
-            'rcv_vertical': []
-        }
+        # Particles only get into the lift by falling into the entry row, so an
+        # empty lift stays empty until one lands there
+        if self._population == 0 and all(grid.is_empty(x, y) for x, y in self._entry_cells):
+            return
         
-        # Classify particles by segment
-        for x, y, particle in particles_to_move:
-            if self.is_inside_cb_vertical(x, y):
-                segments['cb_vertical'].append((x, y, particle))
-            elif self.is_inside_cb_horizontal(x, y):
-                segments['cb_horizontal'].append((x, y, particle))
-            elif self.is_inside_main_vertical(x, y):
-                segments['main_vertical'].append((x, y, particle))
-            elif self.is_inside_rcv_horizontal(x, y):
-                segments['rcv_horizontal'].append((x, y, particle))
-            elif self.is_inside_rcv_vertical(x, y):
-                segments['rcv_vertical'].append((x, y, particle))
+        if self._lift_mask is None:
+            self.bake_mask(grid.width, grid.height)
         
-        # Process each segment in reverse order (exit first)
-        segment_order = ['rcv_vertical', 'rcv_horizontal', 'main_vertical', 'cb_horizontal', 'cb_vertical']
+        # Particle ids along the scan and the positions of the occupied ones. The
+        # entry row is part of the lift, so when none are occupied there is
+        # nothing to count or move.
+        scan_ids = grid.ids.ravel()[self._scan_index]
+        occupied = np.flatnonzero(scan_ids >= 0)
+        if not len(occupied):
+            self._population = 0
+            return
         
-        for segment_name in segment_order:
-            particles = segments[segment_name]
-            self._process_segment_particles(grid, particles, segment_name)
-    
-    def _process_segment_particles(self, grid, particles, segment_name):
-        """Process all particles in a specific segment ensuring no particles are lost"""
-        # Sort particles by their position to avoid conflicts
-        if segment_name == 'cb_vertical':
-            # Sort by y descending (bottom particles move first)
-            particles.sort(key=lambda p: p[1], reverse=True)
-        elif segment_name == 'cb_horizontal':
-            # Sort by x descending (rightmost particles move first)
-            particles.sort(key=lambda p: p[0], reverse=True)
-        elif segment_name == 'main_vertical':
-            # Sort by y ascending (top particles move first)
-            particles.sort(key=lambda p: p[1])
-        elif segment_name == 'rcv_horizontal':
-            # Sort by x ascending (leftmost particles move first)
-            particles.sort(key=lambda p: p[0])
-        elif segment_name == 'rcv_vertical':
-            # Sort by y descending (bottom particles move first)
-            particles.sort(key=lambda p: p[1], reverse=True)
+        # Track particles entering the lift (at entry point)
+        self.particles_entered += int(np.count_nonzero(scan_ids[self._entry_scan] >= 0))
         
-        # Track which destinations are already claimed this frame to prevent conflicts
-        claimed_positions = set()
+        # Move the particles in scan order, segment after segment, each to the
+        # first free cell of its move rule. This allows multiple particles to
+        # move in parallel within each segment. Grid occupancy doubles as the
+        # claim on a destination: moves only lead to cells earlier in the scan
+        # or out of the lift, so a cell taken this update stays occupied until
+        # the update ends. Particles that can't move wait until next frame -
+        # this prevents particle loss.
+        scan_moves = self._scan_moves
+        destinations = grid.move_particles([scan_moves[i] for i in occupied.tolist()])
         
-        for x, y, particle in particles:
-            next_positions = self._get_next_positions(x, y, segment_name)
-            
-            # Try each possible next position, avoiding already claimed positions
-            moved = False
-            for new_x, new_y in next_positions:
-                if (new_x is not None and new_y is not None and 
-                    (new_x, new_y) not in claimed_positions):
-                    # Check if destination is valid and empty
-                    if (grid.is_valid_position(new_x, new_y) and 
-                        grid.is_empty(new_x, new_y)):
-                        grid.move_particle(x, y, new_x, new_y)
-                        claimed_positions.add((new_x, new_y))
-                        moved = True
-                        break
-            
-            # Special handling for particles trying to exit the lift
-            if not moved and segment_name == 'rcv_vertical':
-                # Try to exit to adjacent positions if blocked, but only if at exit point
-                if y >= self.rcv_vt_shaft_y + self.rcv_vt_shaft_height - 1:
-                    exit_positions = self._get_exit_positions(x, y)
-                    for exit_x, exit_y in exit_positions:
-                        if ((exit_x, exit_y) not in claimed_positions and
-                            grid.is_valid_position(exit_x, exit_y) and 
-                            grid.is_empty(exit_x, exit_y) and
-                            not self.is_inside_lift(exit_x, exit_y)):
-                            grid.move_particle(x, y, exit_x, exit_y)
-                            claimed_positions.add((exit_x, exit_y))
-                            moved = True
-                            # Track particles exiting the lift
-                            self.particles_exited += 1
-                            break
-            
-            # If particle moved to a position outside the lift system, count as exit
-            elif moved and segment_name == 'rcv_vertical':
-                new_x, new_y = next_positions[0]  # Get the position it moved to
-                if (new_x is not None and new_y is not None and 
-                    not self.is_inside_lift(new_x, new_y)):
-                    self.particles_exited += 1
-            
-            # If particle still can't move and is at a transition point, 
-            # it will wait until next frame - this prevents particle loss
+        # Track particles exiting the lift, the only moves leading outside it
+        row_bits = self._row_bits
+        exited = 0
+        for destination in destinations:
+            if destination is not None:
+                new_x, new_y = destination
+                if not (row_bits[new_y] >> new_x) & 1:
+                    exited += 1
+        self.particles_exited += exited
+        self._population = len(destinations) - exited
     
-    def _get_next_positions(self, x, y, segment_name):
-        """Get possible next positions for a particle based on its current segment"""
+    def _compute_next_positions(self, x, y, segment_name):
+        """Compute possible next positions for a particle based on its current segment"""
         positions = []
         
         if segment_name == 'cb_vertical':
@@ -305,13 +379,8 @@ class Lift:
     
     def _get_exit_positions(self, x, y):
         """Get possible exit positions when particle is blocked at lift exit"""
-        positions = []
         # Try center, left, then right
-        for dx in [0, -1, 1]:
-            exit_x = x + dx
-            exit_y = y + 1
-            positions.append((exit_x, exit_y))
-        return positions
+        return ((x, y + 1), (x - 1, y + 1), (x + 1, y + 1))
     
     def get_conservation_stats(self):
         """Get particle conservation statistics"""
@@ -323,48 +392,30 @@ class Lift:
     
     def draw(self, screen, cell_size):
         """Draw the lift system"""
+        # The shafts never move, so render them once per cell size and blit the result
+        if self._draw_cell_size != cell_size:
+            self._build_draw_cache(cell_size)
+        
+        screen.blit(self._draw_surface, self._draw_pos)
+    
+    def _build_draw_cache(self, cell_size):
+        """Render the shafts onto a surface covering their bounding box"""
         wall_color = (128, 128, 128)  # Gray for lift structure
+        transparent = (255, 0, 255)  # Colorkey for the gaps between the shafts
         
-        # Vertical shaft connected to cold bin
-        shaft_rect = pygame.Rect(
-            self.cb_shaft_x * cell_size,
-            self.cb_shaft_y * cell_size,
-            self.shaft_width * cell_size,
-            self.cb_shaft_height * cell_size
-        )
-        pygame.draw.rect(screen, wall_color, shaft_rect)
+        rects = [
+            pygame.Rect(x * cell_size, y * cell_size, w * cell_size, h * cell_size)
+            for x, y, w, h in self.get_segment_rects()
+        ]
+        bounds = rects[0].unionall(rects[1:])
         
-        # Horizontal shaft connecting to cold bin
-        cb_hz_rect = pygame.Rect(
-            self.cb_hz_shaft_x * cell_size,
-            self.cb_hz_shaft_y * cell_size,
-            self.cb_hz_shaft_length * cell_size,
-            self.shaft_width * cell_size
-        )
-        pygame.draw.rect(screen, wall_color, cb_hz_rect)
+        surface = pygame.Surface(bounds.size)
+        surface.fill(transparent)
+        surface.set_colorkey(transparent, pygame.RLEACCEL)
+        # Shafts are axis-aligned filled rectangles, so a plain fill draws them
+        for rect in rects:
+            surface.fill(wall_color, rect.move(-bounds.x, -bounds.y))
         
-        main_shaft_rect = pygame.Rect(
-            self.main_shaft_x * cell_size,
-            self.main_shaft_y * cell_size,
-            self.shaft_width * cell_size,
-            self.main_shaft_height * cell_size
-        )
-        pygame.draw.rect(screen, wall_color, main_shaft_rect)
-
-        # Horizontal shaft connecting to receiver
-        rcv_hz_rect = pygame.Rect(
-            self.rcv_hz_shaft_x * cell_size,
-            self.rcv_hz_shaft_y * cell_size,
-            self.rcv_hz_shaft_length * cell_size,
-            self.shaft_width * cell_size
-        )
-        pygame.draw.rect(screen, wall_color, rcv_hz_rect)
-
-        # Vertical shaft connecting to receiver
-        rcv_vt_rect = pygame.Rect(
-            self.rcv_vt_shaft_x * cell_size,
-            self.rcv_vt_shaft_y * cell_size,
-            self.shaft_width * cell_size,
-            self.rcv_vt_shaft_height * cell_size
-        )
-        pygame.draw.rect(screen, wall_color, rcv_vt_rect)
\ No newline at end of file
+        self._draw_surface = surface
+        self._draw_pos = bounds.topleft
+        self._draw_cell_size = cell_size
\ No newline at end of file
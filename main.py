@@ -24,6 +24,35 @@ def main():
     font = pygame.font.Font(None, 36)
     small_font = pygame.font.Font(None, 24)
     
+    # Static text is rendered once up front
+    start_text = font.render("Press SPACE to start", True, (255, 255, 255))
+    start_text_rect = start_text.get_rect(center=(SCREEN_WIDTH // 2, 50))
+    instructions = [
+        "Complete cycle: Heat → Cool → Lift → Separate → Repeat",
+        "Yellow PSG slows particles and gradually cools them",
+        "Orange receiver gradually heats particles",
+        "Particles lose heat over time in different equipment",
+        "Both bins open/close every 5 seconds"
+    ]
+    instruction_blits = [
+        (small_font.render(instruction, True, (200, 200, 200)), (10, SCREEN_HEIGHT - 110 + i * 20))
+        for i, instruction in enumerate(instructions)
+    ]
+    
+    # Stat lines are a fixed label plus formatted values; the values are
+    # only formatted and re-rendered when they change
+    hud_cache = {}
+    
+    def render_hud_line(line, prefix, value_format, values, color):
+        cached = hud_cache.get(line)
+        if cached is None or cached[0] != (prefix, value_format, color):
+            cached = [(prefix, value_format, color), small_font.render(prefix, True, color), None, None]
+            hud_cache[line] = cached
+        if cached[2] != values:
+            cached[2] = values
+            cached[3] = small_font.render(value_format.format(*values), True, color)
+        return cached[1], cached[3]
+    
     # Game state
     started = False
     
@@ -56,82 +85,42 @@ def main():
         # Draw UI
         if not started:
             # Start instruction
-            text = font.render("Press SPACE to start", True, (255, 255, 255))
-            text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, 50))
-            screen.blit(text, text_rect)
+            screen.blit(start_text, start_text_rect)
         else:
             # Show stats
             stats = simulation.get_stats()
             y_offset = 10
             line_height = 25
             
-            # Basic stats
-            stats_text = small_font.render(
-                f"Spawned: {stats['spawned']}/{stats['max_spawn']}", 
-                True, (255, 255, 255)
-            )
-            screen.blit(stats_text, (10, y_offset))
-            y_offset += line_height
-            
-            # Show hot bin status
-            hotbin_text = small_font.render(
-                f"Hot Bin: {stats['hotbin_status']}", 
-                True, (255, 255, 255)
-            )
-            screen.blit(hotbin_text, (10, y_offset))
-            y_offset += line_height
-            
-            # Show cold bin status
-            coldbin_text = small_font.render(
-                f"Cold Bin: {stats['coldbin_status']}", 
-                True, (255, 255, 255)
-            )
-            screen.blit(coldbin_text, (10, y_offset))
-            y_offset += line_height
-            
-            # Show lift conservation stats
-            lift_text = small_font.render(
-                f"Lift: In={stats['lift_entered']} Out={stats['lift_exited']} Transit={stats['lift_in_transit']}", 
-                True, (255, 255, 255)
-            )
-            screen.blit(lift_text, (10, y_offset))
-            y_offset += line_height
-            
-            # Show thermal stats
-            psg_text = small_font.render(
-                f"PSG Heat Extracted: {stats['psg_heat_extracted']:.1f}°", 
-                True, (100, 150, 255)  # Light blue for cooling
-            )
-            screen.blit(psg_text, (10, y_offset))
-            y_offset += line_height
-            
-            receiver_text = small_font.render(
-                f"Receiver Heat Added: {stats['receiver_heat_added']:.1f}°", 
-                True, (255, 150, 100)  # Light orange for heating
-            )
-            screen.blit(receiver_text, (10, y_offset))
-            y_offset += line_height
-            
+            lines = [
+                # Basic stats
+                ("Spawned: ", "{}/{}", (stats['spawned'], stats['max_spawn']), (255, 255, 255)),
+                # Show hot bin status
+                ("Hot Bin: ", "{}", (stats['hotbin_status'],), (255, 255, 255)),
+                # Show cold bin status
+                ("Cold Bin: ", "{}", (stats['coldbin_status'],), (255, 255, 255)),
+                # Show lift conservation stats
+                ("Lift: ", "In={} Out={} Transit={}",
+                 (stats['lift_entered'], stats['lift_exited'], stats['lift_in_transit']), (255, 255, 255)),
+                # Show thermal stats
+                ("PSG Heat Extracted: ", "{:.1f}°", (stats['psg_heat_extracted'],),
+                 (100, 150, 255)),  # Light blue for cooling
+                ("Receiver Heat Added: ", "{:.1f}°", (stats['receiver_heat_added'],),
+                 (255, 150, 100))  # Light orange for heating
+            ]
             if stats['spawning_complete']:
-                complete_text = small_font.render(
-                    "Spawning complete - particles cycling!", 
-                    True, (0, 255, 0)
-                )
-                screen.blit(complete_text, (10, y_offset))
+                lines.append(("Spawning complete - particles cycling!", "", (), (0, 255, 0)))
+            
+            hud_blits = []
+            for line, (prefix, value_format, values, color) in enumerate(lines):
+                prefix_surface, value_surface = render_hud_line(line, prefix, value_format, values, color)
+                hud_blits.append((prefix_surface, (10, y_offset)))
+                hud_blits.append((value_surface, (10 + prefix_surface.get_width(), y_offset)))
                 y_offset += line_height
+            screen.blits(hud_blits, doreturn=False)
         
         # Draw instructions
-        instructions = [
-            "Complete cycle: Heat → Cool → Lift → Separate → Repeat",
-            "Yellow PSG slows particles and gradually cools them",
-            "Orange receiver gradually heats particles",
-            "Particles lose heat over time in different equipment",
-            "Both bins open/close every 5 seconds"
-        ]
-        
-        for i, instruction in enumerate(instructions):
-            text = small_font.render(instruction, True, (200, 200, 200))
-            screen.blit(text, (10, SCREEN_HEIGHT - 110 + i * 20))
+        screen.blits(instruction_blits, doreturn=False)
         
         # Update display
         pygame.display.flip()
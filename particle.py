@@ -1,8 +1,75 @@
 import pygame
 import colorsys
+import functools
+
+
+@functools.lru_cache(maxsize=4096)
+def temperature_color(temperature, max_temperature):
+    """Get the color for a whole-degree temperature, cached since only a few hundred distinct ones occur"""
+    if temperature == 0:
+        # Base sand color
+        return (194, 178, 128)  # Light brown/sand color
+    
+    # Interpolate from sand color to red based on temperature
+    temp_ratio = min(temperature / max_temperature, 1.0)
+    
+    # Base sand color (HSV: hue=45, sat=0.34, val=0.76)
+    base_h, base_s, base_v = 0.125, 0.34, 0.76
+    # Red color (HSV: hue=0, sat=1.0, val=1.0)
+    target_h, target_s, target_v = 0.0, 1.0, 1.0
+    
+    # Interpolate HSV values
+    h = base_h + (target_h - base_h) * temp_ratio
+    s = base_s + (target_s - base_s) * temp_ratio
+    v = base_v + (target_v - base_v) * temp_ratio
+    
+    # Convert HSV to RGB
+    r, g, b = colorsys.hsv_to_rgb(h, s, v)
+    return (int(r * 255), int(g * 255), int(b * 255))
+
+
+def _whole_degrees(value):
+    """Round a temperature to whole degrees, clamped to the grid's 16-bit temperature columns"""
+    return min(max(int(round(value)), -32768), 32767)
+
+
+def _stored(local, column, convert=None, recolor=False):
+    """Property kept in a grid column while the particle is placed, and in an attribute otherwise"""
+    def get(self):
+        grid = self._grid
+        if grid is None:
+            return getattr(self, local)
+        return getattr(grid, column)[self._id]
+    def set(self, value):
+        if convert is not None:
+            value = convert(value)
+        grid = self._grid
+        if grid is None:
+            setattr(self, local, value)
+        else:
+            getattr(grid, column)[self._id] = value
+            if recolor:
+                grid.mark_dirty_id(self._id)
+    return property(get, set)
+
 
 class Particle:
+    # While placed on a grid, position and temperature live in the grid's
+    # per-ID columns (see Grid.place_particle); the object is only a view.
+    # Temperatures are whole degrees in -32768..32767: assigned values are rounded
+    # and clamped, placed or not, and a placed particle is recolored on the next draw.
+    x = _stored('_x', '_xs')
+    y = _stored('_y', '_ys')
+    temperature = _stored('_temperature', '_temperatures', _whole_degrees, True)
+    max_temperature = _stored('_max_temperature', '_max_temperatures', _whole_degrees, True)
+    last_thermal_loss_frame = _stored('_last_thermal_loss_frame', '_last_loss_frames')
+    thermal_loss_interval = _stored('_thermal_loss_interval', '_loss_intervals')
+    _STORED = ('x', 'y', 'temperature', 'max_temperature', 'last_thermal_loss_frame',
+               'thermal_loss_interval')
+    
     def __init__(self, x, y, temperature=0):
+        self._grid = None
+        self._id = -1
         self.x = x
         self.y = y
         self.temperature = temperature
@@ -14,26 +81,7 @@ class Particle:
         
     def get_color(self):
         """Get particle color based on temperature (cooler = yellow/brown, hotter = red)"""
-        if self.temperature == 0:
-            # Base sand color
-            return (194, 178, 128)  # Light brown/sand color
-        
-        # Interpolate from sand color to red based on temperature
-        temp_ratio = min(self.temperature / self.max_temperature, 1.0)
-        
-        # Base sand color (HSV: hue=45, sat=0.34, val=0.76)
-        base_h, base_s, base_v = 0.125, 0.34, 0.76
-        # Red color (HSV: hue=0, sat=1.0, val=1.0)
-        target_h, target_s, target_v = 0.0, 1.0, 1.0
-        
-        # Interpolate HSV values
-        h = base_h + (target_h - base_h) * temp_ratio
-        s = base_s + (target_s - base_s) * temp_ratio
-        v = base_v + (target_v - base_v) * temp_ratio
-        
-        # Convert HSV to RGB
-        r, g, b = colorsys.hsv_to_rgb(h, s, v)
-        return (int(r * 255), int(g * 255), int(b * 255))
+        return temperature_color(self.temperature, self.max_temperature)
     
     def heat(self, amount):
         """Increase particle temperature"""
@@ -49,6 +97,20 @@ class Particle:
             self.cool(loss_amount)
             self.last_thermal_loss_frame = current_frame
     
+    def attach(self, grid, particle_id):
+        """Move the particle's state into the grid's columns under particle_id"""
+        state = [getattr(self, name) for name in self._STORED]
+        self._grid, self._id = grid, particle_id
+        for name, value in zip(self._STORED, state):
+            setattr(self, name, value)
+    
+    def detach(self):
+        """Copy the particle's state back out of the grid's columns"""
+        state = [getattr(self, name) for name in self._STORED]
+        self._grid, self._id = None, -1
+        for name, value in zip(self._STORED, state):
+            setattr(self, name, value)
+    
     def move_to(self, new_x, new_y):
         """Move particle to new position"""
         self.x = new_x
@@ -1,4 +1,5 @@
 import pygame
+import numpy as np
 
 class PSG:
     def __init__(self, hotbin_x, hotbin_y, hotbin_width):
@@ -20,11 +21,18 @@ class PSG:
         # Speed reduction parameters
         self.slow_factor = 5  # Particles move 5x slower in PSG
         
+        # Pre-rendered body and border, built on first draw for the given cell size
+        self._draw_cell_size = None
+        
     def is_inside(self, x, y):
         """Check if position is inside the PSG"""
         return (self.x <= x < self.x + self.width and 
                 self.y <= y < self.y + self.height)
     
+    def get_inside_rect(self):
+        """Get the PSG area rectangle (x, y, width, height) in grid cells"""
+        return (self.x, self.y, self.width, self.height)
+    
     def should_particle_move_slow(self, x, y):
         """Check if particle at position should move slowly"""
         return self.is_inside(x, y)
@@ -33,19 +41,17 @@ class PSG:
         """Update cooling for particles inside the PSG"""
         self.frame_counter += 1
         
-        # Only apply cooling every cooling_interval frames
-        if self.frame_counter % self.cooling_interval != 0:
+        # Only apply cooling every cooling_interval frames (every frame needs no modulo)
+        if self.cooling_interval != 1 and self.frame_counter % self.cooling_interval != 0:
             return
         
-        # Find all particles inside the PSG and cool them
-        for y in range(self.y, self.y + self.height):
-            for x in range(self.x, self.x + self.width):
-                particle = grid.get_particle(x, y)
-                if particle and self.is_inside(x, y):
-                    # Calculate heat to remove (don't go below 0)
-                    heat_to_remove = min(self.cooling_rate, particle.temperature)
-                    particle.temperature = max(0, particle.temperature - heat_to_remove)
-                    self.total_heat_extracted += heat_to_remove
+        # Cool every particle inside the PSG at once (don't go below 0)
+        particle_ids = grid.ids_in_region(self.x, self.y, self.width, self.height)
+        if len(particle_ids):
+            temperatures = grid.temperature[particle_ids]
+            heat_to_remove = np.minimum(self.cooling_rate, temperatures)
+            cooled = grid.store_temperatures(particle_ids, temperatures - heat_to_remove)
+            self.total_heat_extracted += int(temperatures.sum()) - int(cooled.sum())
     
     def cool_particle(self, particle):
         """Legacy method - now handled by update_particles_in_psg"""
@@ -60,12 +66,20 @@ class PSG:
     
     def draw(self, screen, cell_size):
         """Draw the PSG on screen"""
-        rect = pygame.Rect(
-            self.x * cell_size,
-            self.y * cell_size,
-            self.width * cell_size,
-            self.height * cell_size
-        )
+        # The PSG never moves, so render it once per cell size and blit the result
+        if self._draw_cell_size != cell_size:
+            self._build_draw_cache(cell_size)
+        
+        screen.blit(self._draw_surface, self._draw_pos)
+    
+    def _build_draw_cache(self, cell_size):
+        """Render the PSG body and border onto a surface of its own size"""
+        rect = pygame.Rect(0, 0, self.width * cell_size, self.height * cell_size)
+        surface = pygame.Surface(rect.size)
         # Draw PSG as a bright yellow rectangle
-        pygame.draw.rect(screen, (255, 255, 0), rect)
-        pygame.draw.rect(screen, (255, 255, 150), rect, 2)  # Lighter yellow border
\ No newline at end of file
+        pygame.draw.rect(surface, (255, 255, 0), rect)
+        pygame.draw.rect(surface, (255, 255, 150), rect, 2)  # Lighter yellow border
+        
+        self._draw_surface = surface
+        self._draw_pos = (self.x * cell_size, self.y * cell_size)
+        self._draw_cell_size = cell_size
\ No newline at end of file
@@ -1,4 +1,5 @@
 import pygame
+import numpy as np
 
 class Receiver:
     def __init__(self, grid_width, grid_height):
@@ -19,6 +20,9 @@ class Receiver:
         # Statistics tracking
         self.total_heat_added = 0
         
+        # Pre-rendered body and border, built on first draw for the given cell size
+        self._draw_cell_size = None
+        
     def is_inside(self, x, y):
         """Check if position is inside the receiver"""
         return (self.x <= x < self.x + self.width and 
@@ -28,19 +32,18 @@ class Receiver:
         """Update heating for particles inside the receiver"""
         self.frame_counter += 1
         
-        # Only apply heating every heating_interval frames
-        if self.frame_counter % self.heating_interval != 0:
+        # Only apply heating every heating_interval frames (every frame needs no modulo)
+        if self.heating_interval != 1 and self.frame_counter % self.heating_interval != 0:
             return
         
-        # Find all particles inside the receiver and heat them
-        for y in range(self.y, self.y + self.height):
-            for x in range(self.x, self.x + self.width):
-                particle = grid.get_particle(x, y)
-                if particle and self.is_inside(x, y):
-                    # Calculate heat to add (don't exceed max temperature)
-                    heat_to_add = min(self.heating_rate, particle.max_temperature - particle.temperature)
-                    particle.temperature = min(particle.max_temperature, particle.temperature + heat_to_add)
-                    self.total_heat_added += heat_to_add
+        # Heat every particle inside the receiver at once (don't exceed max temperature)
+        particle_ids = grid.ids_in_region(self.x, self.y, self.width, self.height)
+        if len(particle_ids):
+            temperatures = grid.temperature[particle_ids]
+            heat_to_add = np.minimum(self.heating_rate,
+                                     grid.max_temperature[particle_ids] - temperatures)
+            heated = grid.store_temperatures(particle_ids, temperatures + heat_to_add)
+            self.total_heat_added += int(heated.sum()) - int(temperatures.sum())
     
     def heat_particle(self, particle):
         """Legacy method - now handled by update_particles_in_receiver"""
@@ -55,12 +58,20 @@ class Receiver:
     
     def draw(self, screen, cell_size):
         """Draw the receiver on screen"""
-        rect = pygame.Rect(
-            self.x * cell_size,
-            self.y * cell_size,
-            self.width * cell_size,
-            self.height * cell_size
-        )
+        # The receiver never moves, so render it once per cell size and blit the result
+        if self._draw_cell_size != cell_size:
+            self._build_draw_cache(cell_size)
+        
+        screen.blit(self._draw_surface, self._draw_pos)
+    
+    def _build_draw_cache(self, cell_size):
+        """Render the receiver body and border onto a surface of its own size"""
+        rect = pygame.Rect(0, 0, self.width * cell_size, self.height * cell_size)
+        surface = pygame.Surface(rect.size)
         # Draw receiver as a bright orange/red rectangle
-        pygame.draw.rect(screen, (255, 100, 0), rect)
-        pygame.draw.rect(screen, (255, 200, 0), rect, 2)  # Border
\ No newline at end of file
+        pygame.draw.rect(surface, (255, 100, 0), rect)
+        pygame.draw.rect(surface, (255, 200, 0), rect, 2)  # Border
+        
+        self._draw_surface = surface
+        self._draw_pos = (self.x * cell_size, self.y * cell_size)
+        self._draw_cell_size = cell_size
\ No newline at end of file
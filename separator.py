@@ -1,5 +1,6 @@
 import pygame
 import random
+import numpy as np
 
 class Separator:
     def __init__(self, receiver_x, receiver_y, receiver_width):
@@ -25,8 +26,33 @@ class Separator:
         self.distribution_end_x = self.x + self.width - self.thickness
         self.distribution_width = self.distribution_end_x - self.distribution_start_x
         
+        # Screen rectangles and overlay of the walls and distribution area, built on first draw for the given cell size
+        self._draw_cell_size = None
+        
+        # Boolean masks of the wall and inside cells over the whole grid, see bake_masks
+        self.wall_mask = None
+        self.inside_mask = None
+        
+    def bake_masks(self, grid_width, grid_height):
+        """Precompute grid-sized wall and inside masks for O(1) lookups"""
+        shape = (grid_height, grid_width)
+        walls = np.zeros(shape, dtype=bool)
+        for x, y, w, h in self.get_wall_rects():
+            walls[max(0, y):max(0, y + h), max(0, x):max(0, x + w)] = True
+        inside = np.zeros(shape, dtype=bool)
+        x, y, w, h = self.get_inside_rect()
+        inside[max(0, y):max(0, y + h), max(0, x):max(0, x + w)] = True
+        
+        self.wall_mask, self.inside_mask = walls, inside
+        self._wall_cells, self._inside_cells = memoryview(walls), memoryview(inside)
+        self._mask_width, self._mask_height = grid_width, grid_height
+    
     def is_wall(self, x, y):
         """Check if position is a wall of the separator (solid)"""
+        if self.wall_mask is not None:
+            return (0 <= x < self._mask_width and 0 <= y < self._mask_height and
+                    self._wall_cells[y, x])
+        
         # Left wall
         if (x >= self.left_wall_x and x < self.left_wall_x + self.thickness and 
             y >= self.y and y < self.y + self.height):
@@ -46,11 +72,24 @@ class Separator:
     
     def is_inside(self, x, y):
         """Check if position is inside the separator (where particles can be redistributed)"""
+        if self.inside_mask is not None:
+            return (0 <= x < self._mask_width and 0 <= y < self._mask_height and
+                    self._inside_cells[y, x])
         return (x >= self.distribution_start_x and 
                 x < self.distribution_end_x and
                 y >= self.y and 
                 y < self.bottom_y)
     
+    def is_inside_batch(self, xs, ys):
+        """Vectorized is_inside over arrays of positions, returning a boolean array"""
+        xs, ys = np.asarray(xs), np.asarray(ys)
+        if self.inside_mask is not None:
+            inside = (0 <= xs) & (xs < self._mask_width) & (0 <= ys) & (ys < self._mask_height)
+            inside[inside] = self.inside_mask[ys[inside], xs[inside]]
+            return inside
+        return ((xs >= self.distribution_start_x) & (xs < self.distribution_end_x) &
+                (ys >= self.y) & (ys < self.bottom_y))
+    
     def can_enter_separator(self, x, y):
         """Check if a particle can enter the separator from above"""
         # Particles can enter from the top opening of the U
@@ -60,46 +99,26 @@ class Separator:
     
     def separate_particle(self, particle, grid):
         """Separate a particle by redistributing its x position within the separator"""
-        # Find a random x position within the distribution area
-        attempts = 0
-        max_attempts = self.distribution_width
+        # Particles leave through the row below the floor of the U
+        exit_y = self.bottom_y + self.thickness
+        if not 0 <= exit_y < grid.height:
+            return None, None
         
-        while attempts < max_attempts:
-            # Random x position within the separator width
-            new_x = random.randint(self.distribution_start_x, self.distribution_end_x - 1)
-            
-            # Try to place at the bottom of the separator
-            exit_y = self.bottom_y + self.thickness
-            
-            # Check if the exit position is available
-            if (grid.is_valid_position(new_x, exit_y) and 
-                grid.is_empty(new_x, exit_y)):
-                return new_x, exit_y
-            
-            attempts += 1
-        
-        # If no random position is available, try sequential positions
-        for offset in range(self.distribution_width):
-            new_x = self.distribution_start_x + offset
-            exit_y = self.bottom_y + self.thickness
-            
-            if (grid.is_valid_position(new_x, exit_y) and 
-                grid.is_empty(new_x, exit_y)):
-                return new_x, exit_y
-        
-        # If still no position available, return None (particle waits)
-        return None, None
+        # Pick a random free cell of that row in one go, so a crowded row
+        # costs no retries
+        row = grid.ids[exit_y, self.distribution_start_x:self.distribution_end_x]
+        free = np.flatnonzero(row < 0)
+        if len(free) == 0:
+            # No position available, the particle waits
+            return None, None
+        return self.distribution_start_x + random.choice(free.tolist()), exit_y
     
     def update_particles_in_separator(self, grid):
         """Update particles inside the separator, redistributing them"""
-        particles_to_separate = []
-        
-        # Find all particles inside the separator
-        for y in range(self.y, self.bottom_y + self.thickness):
-            for x in range(self.distribution_start_x, self.distribution_end_x):
-                particle = grid.get_particle(x, y)
-                if particle and self.is_inside(x, y):
-                    particles_to_separate.append((x, y, particle))
+        # Find all particles inside the separator, in row-major order
+        particles_to_separate = grid.particles_in_region(*self.get_inside_rect())
+        if not particles_to_separate:
+            return
         
         # Process particles for separation
         for x, y, particle in particles_to_separate:
@@ -110,6 +129,23 @@ class Separator:
                 # Move particle to new distributed position
                 grid.move_particle(x, y, new_x, new_y)
     
+    def get_wall_rects(self):
+        """Get the wall rectangles (x, y, width, height) of the U in grid cells"""
+        return [
+            (self.left_wall_x, self.y, self.thickness, self.height),
+            (self.right_wall_x, self.y, self.thickness, self.height),
+            (self.x, self.bottom_y, self.width, self.thickness)
+        ]
+    
+    def get_inside_rect(self):
+        """Get the distribution area rectangle (x, y, width, height) in grid cells"""
+        return (self.distribution_start_x, self.y,
+                self.distribution_width, self.bottom_y - self.y)
+    
+    def get_entry_rect(self):
+        """Get the row above the opening where particles can enter, as (x, y, width, height)"""
+        return (self.distribution_start_x, self.y - 1, self.distribution_width, 1)
+    
     def get_separator_bounds(self):
         """Get the bounds of the separator for collision detection"""
         return {
@@ -124,45 +160,31 @@ class Separator:
     
     def draw(self, screen, cell_size):
         """Draw the U-shaped separator on screen"""
-        # Draw walls as dark gray rectangles
-        wall_color = (80, 80, 80)  # Dark gray
-        
-        # Left wall
-        left_wall = pygame.Rect(
-            self.left_wall_x * cell_size,
-            self.y * cell_size,
-            self.thickness * cell_size,
-            self.height * cell_size
-        )
-        pygame.draw.rect(screen, wall_color, left_wall)
+        if self._draw_cell_size != cell_size:
+            self._build_draw_cache(cell_size)
         
-        # Right wall
-        right_wall = pygame.Rect(
-            self.right_wall_x * cell_size,
-            self.y * cell_size,
-            self.thickness * cell_size,
-            self.height * cell_size
-        )
-        pygame.draw.rect(screen, wall_color, right_wall)
-        
-        # Bottom wall (floor of U)
-        bottom_wall = pygame.Rect(
-            self.x * cell_size,
-            self.bottom_y * cell_size,
-            self.width * cell_size,
-            self.thickness * cell_size
-        )
-        pygame.draw.rect(screen, wall_color, bottom_wall)
+        # Draw walls (left, right and floor of the U) as dark gray rectangles
+        wall_color = (80, 80, 80)  # Dark gray
+        for rect in self._wall_rects:
+            screen.fill(wall_color, rect)
         
-        # Draw a subtle inner indication to show distribution area
-        inner_rect = pygame.Rect(
+        # Draw a translucent overlay to show separation area
+        screen.blit(self._glow_surface, self._glow_rect)
+    
+    def _build_draw_cache(self, cell_size):
+        """Scale the wall rectangles and build the distribution area overlay for a cell size"""
+        # The separator never moves, so this only happens when the cell size changes
+        self._wall_rects = [
+            pygame.Rect(x * cell_size, y * cell_size, w * cell_size, h * cell_size)
+            for x, y, w, h in self.get_wall_rects()
+        ]
+        self._glow_rect = pygame.Rect(
             self.distribution_start_x * cell_size,
             self.y * cell_size,
             self.distribution_width * cell_size,
             (self.height - self.thickness) * cell_size
         )
-        # Draw a translucent overlay to show separation area
-        glow_surface = pygame.Surface((inner_rect.width, inner_rect.height))
-        glow_surface.set_alpha(20)
-        glow_surface.fill((150, 150, 150))
-        screen.blit(glow_surface, (inner_rect.x, inner_rect.y))
\ No newline at end of file
+        self._glow_surface = pygame.Surface(self._glow_rect.size)
+        self._glow_surface.set_alpha(20)
+        self._glow_surface.fill((150, 150, 150))
+        self._draw_cell_size = cell_size
\ No newline at end of file
@@ -1,5 +1,7 @@
 import pygame
 import random
+import functools
+import numpy as np
 from grid import Grid
 from particle import Particle
 from receiver import Receiver
@@ -9,6 +11,24 @@ from coldbin import ColdBin
 from lift import Lift
 from separator import Separator
 
+# Regions with their own thermal loss rate, indexed by Simulation.region_ids
+THERMAL_REGIONS = ('default', 'lift', 'hotbin', 'coldbin', 'psg')
+
+
+@functools.lru_cache(maxsize=1024)
+def _bin_status(timer, cycle_duration):
+    """Get the status text of a bin that is closed then open for cycle_duration frames each"""
+    # Calculate time remaining in current cycle
+    cycle_position = timer % (cycle_duration * 2)
+    if cycle_position < cycle_duration:
+        # Currently closed
+        time_remaining = (cycle_duration - cycle_position) // 60
+        return f"Closed (opens in {time_remaining}s)"
+    # Currently open
+    time_remaining = (cycle_duration * 2 - cycle_position) // 60
+    return f"Open (closes in {time_remaining}s)"
+
+
 class Simulation:
     def __init__(self, screen_width=800, screen_height=900, cell_size=8):
         self.screen_width = screen_width
@@ -26,7 +46,24 @@ class Simulation:
         self.hotbin = HotBin(self.receiver.x, self.receiver.y, self.receiver.width)
         self.psg = PSG(self.hotbin.x, self.hotbin.y, self.hotbin.width)
         self.coldbin = ColdBin(self.psg.x, self.psg.y, self.psg.width)
+        self.hotbin.bake_wall_mask(self.grid_width, self.grid_height)
+        self.coldbin.bake_wall_mask(self.grid_width, self.grid_height)
+        self.separator.bake_masks(self.grid_width, self.grid_height)
         self.lift = Lift(self.coldbin, self.separator.y + self.separator.height)
+        self.lift.bake_mask(self.grid_width, self.grid_height)
+        self.grid.bake_static_flags(self.lift, self.separator, self.psg)
+        
+        # Thermal loss region of every cell, as an index into THERMAL_REGIONS.
+        # Stamped in reverse so that where regions overlap the first one listed wins.
+        region_masks = {
+            'lift': self.lift.lift_mask,
+            'hotbin': self._rect_mask(self.hotbin.get_inside_rect()),
+            'coldbin': self._rect_mask(self.coldbin.get_inside_rect()),
+            'psg': self._rect_mask(self.psg.get_inside_rect())
+        }
+        self.region_ids = np.zeros((self.grid_height, self.grid_width), dtype=np.uint8)
+        for region_id in range(len(THERMAL_REGIONS) - 1, 0, -1):
+            self.region_ids[region_masks[THERMAL_REGIONS[region_id]]] = region_id
         
         # Spawning parameters
         self.spawn_count = 0
@@ -47,6 +84,10 @@ class Simulation:
         self.spawn_x = self.receiver.x + self.receiver.width // 2
         self.spawn_y = max(0, self.receiver.y - 3)  # - X cells above receiver
         
+        # Screen position of the spawn indicator, which never moves
+        self._spawn_indicator_center = (self.spawn_x * cell_size + cell_size // 2,
+                                        self.spawn_y * cell_size + cell_size // 2)
+        
         # Frame counter for thermal loss calculations
         self.frame_counter = 0
         
@@ -61,6 +102,17 @@ class Simulation:
         
         self.running = False
         
+        # Background and equipment, redrawn by draw when a bin opens or closes
+        self._scenery = None
+        self._scenery_key = None
+        
+    def _rect_mask(self, rect):
+        """Get a grid-sized boolean mask of an (x, y, width, height) rectangle of cells"""
+        x, y, width, height = rect
+        mask = np.zeros((self.grid_height, self.grid_width), dtype=bool)
+        mask[max(0, y):max(0, y + height), max(0, x):max(0, x + width)] = True
+        return mask
+    
     def start(self):
         """Start the simulation"""
         self.running = True
@@ -84,26 +136,25 @@ class Simulation:
     
     def apply_thermal_losses(self):
         """Apply thermal losses to all particles based on their location"""
-        for y in range(self.grid_height):
-            for x in range(self.grid_width):
-                particle = self.grid.get_particle(x, y)
-                if particle is None:
-                    continue
-                
-                # Determine thermal loss rate based on location
-                loss_rate = self.thermal_loss_rates['default']
-                
-                if self.lift.is_inside_lift(x, y):
-                    loss_rate = self.thermal_loss_rates['lift']
-                elif self.hotbin.is_inside(x, y):
-                    loss_rate = self.thermal_loss_rates['hotbin']
-                elif self.coldbin.is_inside(x, y):
-                    loss_rate = self.thermal_loss_rates['coldbin']
-                elif self.psg.is_inside(x, y):
-                    loss_rate = self.thermal_loss_rates['psg']
-                
-                # Apply thermal loss
-                particle.apply_thermal_loss(loss_rate, self.frame_counter)
+        grid = self.grid
+        occupied = grid.ids >= 0
+        particle_ids = grid.ids[occupied]
+        
+        # Only particles whose loss interval has elapsed lose heat this frame
+        due = (self.frame_counter - grid.last_thermal_loss_frame[particle_ids] >=
+               grid.thermal_loss_interval[particle_ids])
+        if not due.any():
+            return
+        particle_ids = particle_ids[due]
+        
+        # Determine thermal loss rate based on location
+        rates = np.array([self.thermal_loss_rates[name] for name in THERMAL_REGIONS])
+        loss_rate = rates[self.region_ids[occupied][due]]
+        
+        # Apply thermal loss, rounded the same way as Particle.apply_thermal_loss
+        temperatures = grid.temperature[particle_ids]
+        grid.store_temperatures(particle_ids, np.maximum(0, temperatures - loss_rate))
+        grid.last_thermal_loss_frame[particle_ids] = self.frame_counter
     
     def update_physics(self):
         """Update particle physics for entire grid"""
@@ -122,13 +173,12 @@ class Simulation:
         # Apply thermal losses to all particles
         self.apply_thermal_losses()
         
+        # Refresh wall/lift/separator cell flags for this frame's gravity sweep
+        self.grid.update_cell_flags(self.hotbin, self.coldbin)
+        
         # Update particles from bottom to top, right to left to avoid double updates
-        for y in range(self.grid_height - 2, -1, -1):  # Skip bottom row
-            for x in range(self.grid_width - 1, -1, -1):
-                if self.grid.get_particle(x, y) is not None:
-                    # Update particle position (pass all components for collision detection)
-                    # Note: We pass PSG to enable speed reduction
-                    self.grid.update_particle(x, y, self.hotbin, self.coldbin, self.lift, self.separator, self.psg)
+        # Note: We pass PSG to enable speed reduction
+        self.grid.update_particles(self.psg)
     
     def update(self):
         """Update simulation state"""
@@ -142,84 +192,82 @@ class Simulation:
         if self.spawn_timer > 0:
             self.spawn_timer -= 1
             
-        # Try to spawn new particle
-        self.spawn_particle()
+        # Try to spawn new particle (nothing left to do once spawning is complete)
+        if not self.spawning_complete:
+            self.spawn_particle()
         
         # Update hot bin opening/closing cycle
         self.hotbin_timer += 1
         if self.hotbin_timer >= self.hotbin_cycle_duration * 2:  # Full cycle (open + closed)
             self.hotbin_timer = 0
             
-        # Determine if hot bin should be open or closed
+        # Determine if hot bin should be open or closed, and only switch on a change
         # First 10 seconds (0-599): closed
         # Next 10 seconds (600-1199): open
-        if self.hotbin_timer < self.hotbin_cycle_duration:
-            self.hotbin.close_bin()
-        else:
-            self.hotbin.open_bin()
+        hotbin_open = self.hotbin_timer >= self.hotbin_cycle_duration
+        if hotbin_open != self.hotbin.is_open:
+            if hotbin_open:
+                self.hotbin.open_bin()
+            else:
+                self.hotbin.close_bin()
             
         # Update cold bin opening/closing cycle
         self.coldbin_timer += 1
         if self.coldbin_timer >= self.coldbin_cycle_duration * 2:  # Full cycle (open + closed)
             self.coldbin_timer = 0
             
-        # Determine if cold bin should be open or closed
-        if self.coldbin_timer < self.coldbin_cycle_duration:
-            self.coldbin.close_bin()
-        else:
-            self.coldbin.open_bin()
+        # Determine if cold bin should be open or closed, and only switch on a change
+        coldbin_open = self.coldbin_timer >= self.coldbin_cycle_duration
+        if coldbin_open != self.coldbin.is_open:
+            if coldbin_open:
+                self.coldbin.open_bin()
+            else:
+                self.coldbin.close_bin()
         
         # Update physics
         self.update_physics()
     
     def draw(self, screen):
         """Draw the entire simulation"""
-        # Fill background
-        screen.fill((50, 50, 50))
-        
-        # Draw lift system first (as background)
-        self.lift.draw(screen, self.cell_size)
-        
-        # Draw other components
-        self.coldbin.draw(screen, self.cell_size)
-        self.psg.draw(screen, self.cell_size)
-        self.separator.draw(screen, self.cell_size)
-        self.hotbin.draw(screen, self.cell_size)
-        self.receiver.draw(screen, self.cell_size)
+        # The equipment only changes when a bin opens or closes, so it is drawn
+        # onto a cached scenery surface and blitted in one go
+        scenery_key = (screen.get_size(), self.hotbin.is_open, self.coldbin.is_open)
+        if self._scenery_key != scenery_key:
+            self._draw_scenery(screen.get_size())
+            self._scenery_key = scenery_key
+        screen.blit(self._scenery, (0, 0))
         
         # Draw particles on top of everything
         self.grid.draw(screen)
         
         # Draw spawn indicator (small circle above spawn point)
         if not self.spawning_complete:
-            spawn_screen_x = self.spawn_x * self.cell_size + self.cell_size // 2
-            spawn_screen_y = self.spawn_y * self.cell_size + self.cell_size // 2
-            pygame.draw.circle(screen, (255, 255, 255), 
-                             (spawn_screen_x, spawn_screen_y), 3)
+            pygame.draw.circle(screen, (255, 255, 255), self._spawn_indicator_center, 3)
+    
+    def _draw_scenery(self, size):
+        """Draw the background and all equipment onto the scenery surface"""
+        if self._scenery is None or self._scenery.get_size() != size:
+            self._scenery = pygame.Surface(size)
+        scenery = self._scenery
+        
+        # Fill background
+        scenery.fill((50, 50, 50))
+        
+        # Draw lift system first (as background)
+        self.lift.draw(scenery, self.cell_size)
+        
+        # Draw other components
+        self.coldbin.draw(scenery, self.cell_size)
+        self.psg.draw(scenery, self.cell_size)
+        self.separator.draw(scenery, self.cell_size)
+        self.hotbin.draw(scenery, self.cell_size)
+        self.receiver.draw(scenery, self.cell_size)
     
     def get_stats(self):
         """Get simulation statistics"""
-        # Calculate time remaining in current cycle for hot bin
-        hotbin_cycle_position = self.hotbin_timer % (self.hotbin_cycle_duration * 2)
-        if hotbin_cycle_position < self.hotbin_cycle_duration:
-            # Currently closed
-            time_remaining = (self.hotbin_cycle_duration - hotbin_cycle_position) // 60
-            hotbin_status = f"Closed (opens in {time_remaining}s)"
-        else:
-            # Currently open
-            time_remaining = (self.hotbin_cycle_duration * 2 - hotbin_cycle_position) // 60
-            hotbin_status = f"Open (closes in {time_remaining}s)"
-        
-        # Calculate time remaining in current cycle for cold bin
-        coldbin_cycle_position = self.coldbin_timer % (self.coldbin_cycle_duration * 2)
-        if coldbin_cycle_position < self.coldbin_cycle_duration:
-            # Currently closed
-            time_remaining = (self.coldbin_cycle_duration - coldbin_cycle_position) // 60
-            coldbin_status = f"Closed (opens in {time_remaining}s)"
-        else:
-            # Currently open
-            time_remaining = (self.coldbin_cycle_duration * 2 - coldbin_cycle_position) // 60
-            coldbin_status = f"Open (closes in {time_remaining}s)"
+        # Bin status text only changes once a second, so it comes from a cache
+        hotbin_status = _bin_status(self.hotbin_timer, self.hotbin_cycle_duration)
+        coldbin_status = _bin_status(self.coldbin_timer, self.coldbin_cycle_duration)
         
         # Get lift conservation stats
         lift_stats = self.lift.get_conservation_stats()
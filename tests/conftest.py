@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Run pygame headless and import the simulation modules from the repo root
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
\ No newline at end of file
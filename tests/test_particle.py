@@ -0,0 +1,27 @@
+import pygame
+
+from grid import Grid
+from particle import Particle
+
+
+def _drawn_pixel(grid, screen, x, y):
+    """Draw the grid and read back the screen pixel in the middle of cell (x, y)"""
+    grid.draw(screen)
+    half = grid.cell_size // 2
+    return tuple(screen.get_at((x * grid.cell_size + half, y * grid.cell_size + half)))[:3]
+
+
+def test_heating_a_placed_particle_recolors_it():
+    pygame.init()
+    screen = pygame.Surface((80, 80))
+    grid = Grid(10, 10, 8)
+    particle = Particle(3, 4)
+    grid.place_particle(particle, 3, 4)
+    assert _drawn_pixel(grid, screen, 3, 4) == (194, 178, 128)
+    
+    particle.heat(500)
+    assert particle.get_color() == (255, 0, 0)
+    assert _drawn_pixel(grid, screen, 3, 4) == (255, 0, 0)
+    
+    particle.temperature = 0
+    assert _drawn_pixel(grid, screen, 3, 4) == (194, 178, 128)
\ No newline at end of file
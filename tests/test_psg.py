@@ -0,0 +1,19 @@
+from grid import Grid
+from particle import Particle
+from psg import PSG
+
+
+def test_fractional_cooling_rate_matches_particle_cool():
+    grid = Grid(40, 40, 8)
+    psg = PSG(5, 5, 10)
+    psg.cooling_rate = 2.5
+    inside = Particle(psg.x, psg.y, temperature=100)
+    grid.place_particle(inside, psg.x, psg.y)
+    reference = Particle(0, 0, temperature=100)
+    
+    for _ in range(4):
+        psg.update_particles_in_psg(grid)
+        reference.cool(2.5)
+    
+    assert inside.temperature == reference.temperature == 92
+    assert psg.total_heat_extracted == 100 - inside.temperature
\ No newline at end of file
@@ -0,0 +1,19 @@
+from grid import Grid
+from particle import Particle
+from receiver import Receiver
+
+
+def test_fractional_heating_rate_matches_particle_heat():
+    grid = Grid(40, 40, 8)
+    receiver = Receiver(40, 40)
+    receiver.heating_rate = 2.7
+    inside = Particle(receiver.x, receiver.y, temperature=100)
+    grid.place_particle(inside, receiver.x, receiver.y)
+    reference = Particle(0, 0, temperature=100)
+    
+    for _ in range(4):
+        receiver.update_particles_in_receiver(grid)
+        reference.heat(2.7)
+    
+    assert inside.temperature == reference.temperature == 112
+    assert receiver.total_heat_added == inside.temperature - 100
\ No newline at end of file
@@ -0,0 +1,17 @@
+from particle import Particle
+from simulation import Simulation
+
+
+def test_fractional_thermal_loss_rate_matches_particle():
+    simulation = Simulation()
+    simulation.thermal_loss_rates = dict.fromkeys(simulation.thermal_loss_rates, 1.4)
+    placed = Particle(0, 0, temperature=100)
+    simulation.grid.place_particle(placed, 0, 0)
+    reference = Particle(0, 0, temperature=100)
+    
+    for frame in range(0, 50, 10):
+        simulation.frame_counter = frame
+        simulation.apply_thermal_losses()
+        reference.apply_thermal_loss(1.4, frame)
+    
+    assert placed.temperature == reference.temperature == 96
\ No newline at end of file